@@ -9,6 +9,7 @@
 """
 
 import warnings
+from math import hypot
 import numpy as np
 from pyspline import Curve
 from scipy.optimize import brentq, newton, minimize
@@ -66,6 +67,7 @@ class Airfoil:
         self.british_thickness = None
         self.american_thickness = None
         self.nCtl = nCtl
+        self._split_cache = None
 
         # Initialize geometric information
         self.recompute(coords)
@@ -82,43 +84,114 @@ class Airfoil:
         coords : Ndarray [N,2]
             The coordinate pairs to compute the airfoil spline from
 
+        """
+        self._fitSpline(coords)
+
+        self.TE = self.getTE()
+        self.LE, self.s_LE = self.getLE()
+        self._updateChordAndTwist()
+        self.closedCurve = (coords[0, :] == coords[-1, :]).all()
+        self.sampled_pts = None
+        self._split_cache = None
+
+        self._fitAuxSplines(coords.size)
+
+    def _affineTransform(self, func):
+        """
+        Applies a translation, rotation or uniform scaling to the airfoil without refitting the airfoil and camber splines.
+        These transformations leave the chord length parameterization of a spline unchanged, so transforming the control points
+        transforms the curve itself and the parametric location of the LE does not move.
+        The thickness distributions are not invariant under rotation, so the thickness splines are refit.
+
+        Parameters
+        ----------
+        func : callable
+            Function that applies the transformation to an Ndarray [N,2] of coordinate pairs
+
+        """
+        for curve in [self.spline, self.camber]:
+            curve.X = func(curve.X)
+            curve.coef = func(curve.coef)
+
+        self._x = np.ascontiguousarray(self.spline.X[:, 0])
+        self._y = np.ascontiguousarray(self.spline.X[:, 1])
+
+        self.TE = self.getTE()
+        self.LE = self.spline.getValue(self.s_LE)
+        self._updateChordAndTwist()
+        self.sampled_pts = None
+        self._split_cache = None
+
+        self._fitAuxSplines(self.spline.X.size, camber=False)
+
+    def _updateChordAndTwist(self):
+        """
+        Updates the chord and twist, and the quantities cached from them, using the current LE and TE.
+        """
+        self.chord = self.getChord()
+        self._chord_vec = self.LE - self.TE
+        self._chord_sq = self._chord_vec[0] ** 2 + self._chord_vec[1] ** 2
+        self._chord_unit = self._chord_vec / self.chord
+        self.twist = self.getTwist()
+        twist_rad = np.deg2rad(self.twist)
+        self._cos_twist = np.cos(twist_rad)
+        self._sin_twist = np.sin(twist_rad)
+
+    def _fitSpline(self, coords):
+        """
+        Fits the airfoil spline to the given set of coordinates and orients it counter-clockwise.
+
+        Parameters
+        ----------
+        coords : Ndarray [N,2]
+            The coordinate pairs to fit the airfoil spline to
+
         """
         if self.nCtl:
             self.spline = Curve(X=coords, k=self.spline_order, nCtl=self.nCtl)
         else:
             self.spline = Curve(X=coords, k=self.spline_order)
 
+        # Unit-stride copies of the coordinate columns for column-wise operations
+        self._x = np.ascontiguousarray(self.spline.X[:, 0])
+        self._y = np.ascontiguousarray(self.spline.X[:, 1])
+
         self.reorder()
 
-        self.TE = self.getTE()
-        self.LE, self.s_LE = self.getLE()
-        self.chord = self.getChord()
-        self.twist = self.getTwist()
-        self.closedCurve = (coords[0, :] == coords[-1, :]).all()
-        self.sampled_pts = None
+    def _fitAuxSplines(self, nPts, camber=True):
+        """
+        Fits the camber and thickness splines. This relies on the airfoil spline, edges and twist being up to date.
 
-        camber_pts = self.getCDistribution(coords.size)
-        self.camber = Curve(X=camber_pts, k=3)
-        self.british_thickness = Curve(X=self.getThickness(coords.size, "british"), k=3)
-        self.american_thickness = Curve(X=self.getThickness(coords.size, "american"), k=3)
+        Parameters
+        ----------
+        nPts : int
+            The number of points used to sample the camber and thickness distributions
+
+        camber : bool
+            True to refit the camber spline. The thickness splines are always refit, and use the current camber spline.
+
+        """
+        if camber:
+            camber_pts = self.getCDistribution(nPts)
+            self.camber = Curve(X=camber_pts, k=3)
+        self.british_thickness = Curve(X=self.getThickness(nPts, "british"), k=3)
+        self.american_thickness = Curve(X=self.getThickness(nPts, "american"), k=3)
 
     def reorder(self):
         """
         This function orients the points counter-clockwise
         """
 
-        coords = self.spline.X
-        N = coords.shape[0]
+        x = self._x
+        y = self._y
 
         # Accumulate the signed area under each line segment connecting adjacent points
         # If the total area is positive, the points are oriented clockwise
-        area = 0
-        for i in range(N):
-            area += (coords[i, 0] - coords[i - 1, 0]) * (coords[i, 1] + coords[i - 1, 1])
+        area = np.dot(x - np.roll(x, 1), y + np.roll(y, 1))
 
         if area > 0:
-            # Flip orientation to counter-clockwise
-            self.recompute(self.spline.X[::-1, :])
+            # Flip orientation to counter-clockwise, the rest is computed once the orientation is settled
+            self._fitSpline(self.spline.X[::-1, :])
 
     ## Geometry Information
 
@@ -164,18 +237,30 @@ class Airfoil:
         Let the TE be at point :math:`x_0, y_0`, then the Euclidean distance between the TE and any point on the airfoil spline is :math:`\ell(s) = \sqrt{\Delta x^2 + \Delta y^2}`, where :math:`\Delta x = x(s)-x_0` and :math:`\Delta y = y(s)-y_0`. We know near the LE, this quantity is concave. Therefore, to find its maximum, we differentiate and use a root-finding algorithm on its derivative.
         :math:`\\frac{\mathrm{d}\ell}{\mathrm{d}s} = \\frac{\Delta x\\frac{\mathrm{d}x}{\mathrm{d}s} + \Delta y\\frac{\mathrm{d}y}{\mathrm{d}s}}{\ell}`
 
-        The function ``dellds`` computes the quantity :math:`\Delta x\\frac{\mathrm{d}x}{\mathrm{d}s} + \Delta y\\frac{\mathrm{d}y}{\mathrm{d}s}` which is then used by ``brentq`` to find its root, with an initial bracket at :math:`[0.3, 0.7]`.
+        The function ``dellds`` computes the quantity :math:`\Delta x\\frac{\mathrm{d}x}{\mathrm{d}s} + \Delta y\\frac{\mathrm{d}y}{\mathrm{d}s}` which is then used by ``brentq`` to find its root.
+        The distance is first sampled on a coarse grid over :math:`[0.3, 0.7]` with a single vectorized spline evaluation, and the samples neighbouring the farthest one are used as the initial bracket.
+        If the farthest sample lies on the edge of the grid, the full :math:`[0.3, 0.7]` bracket is used instead.
 
         """
 
-        def dellds(s, spline, TE):
-            pt = spline.getValue(s)
-            deriv = spline.getDerivative(s)
-            dx = pt[0] - TE[0]
-            dy = pt[1] - TE[1]
-            return dx * deriv[0] + dy * deriv[1]
+        def dellds(s, spline, TE_x, TE_y):
+            # Work on python floats to keep the per-iteration overhead to a minimum
+            x, y = spline.getValue(s).tolist()
+            dx_ds, dy_ds = spline.getDerivative(s).tolist()
+            return (x - TE_x) * dx_ds + (y - TE_y) * dy_ds
 
-        s_LE = brentq(dellds, 0.3, 0.7, args=(self.spline, self.TE))
+        TE_x, TE_y = self.TE.tolist()
+
+        # Narrow the bracket around the farthest sample from the TE
+        s_grid = np.linspace(0.3, 0.7, 41)
+        pts = self.spline.getValue(s_grid)
+        i_max = np.argmax((pts[:, 0] - TE_x) ** 2 + (pts[:, 1] - TE_y) ** 2)
+        if 0 < i_max < len(s_grid) - 1:
+            s_lower, s_upper = s_grid[i_max - 1], s_grid[i_max + 1]
+        else:
+            s_lower, s_upper = 0.3, 0.7
+
+        s_LE = brentq(dellds, s_lower, s_upper, args=(self.spline, TE_x, TE_y))
         LE = self.spline.getValue(s_LE)
 
         return LE, s_LE
@@ -206,7 +291,7 @@ class Airfoil:
             The chord length
         """
 
-        chord = np.linalg.norm(self.TE - self.LE)
+        chord = hypot(self.TE[0] - self.LE[0], self.TE[1] - self.LE[1])
         return chord
 
     def getSplinePts(self):
@@ -266,7 +351,7 @@ class Airfoil:
         """
         top = self.spline.getValue(0)
         bottom = self.spline.getValue(1)
-        TE_thickness = np.sqrt((top[0] - bottom[0]) ** 2 + (top[1] - bottom[1]) ** 2)
+        TE_thickness = hypot(top[0] - bottom[0], top[1] - bottom[1])
         return TE_thickness
 
     def getLERadius(self):
@@ -283,7 +368,7 @@ class Airfoil:
 
         first = self.spline.getDerivative(self.s_LE)
         second = self.spline.getSecondDerivative(self.s_LE)
-        LE_rad = np.linalg.norm(first) ** 3 / np.linalg.norm(first[0] * second[1] - first[1] * second[0])
+        LE_rad = hypot(first[0], first[1]) ** 3 / abs(first[0] * second[1] - first[1] * second[0])
         return LE_rad
 
     def getCDistribution(self, nPts):
@@ -303,38 +388,40 @@ class Airfoil:
         """
         top_surf, bottom_surf = self.splitAirfoil()
 
-        # Compute the chord
-        chord_pts = np.vstack([self.LE, self.TE])
-        chord = Curve(X=chord_pts, k=2)
-
         # Sampling along airfoil for camber points
         lin_sampling = np.linspace(0, 1, nPts - 1, endpoint=False)[1:]
 
-        chord_pts = chord.getValue(lin_sampling)
-        camber_pts = np.zeros((nPts - 2, 2))
+        # Points along the chord line
+        chord_pts = self.LE + lin_sampling[:, np.newaxis] * (self.TE - self.LE)
+        s_top = np.empty(nPts - 2)
+        s_bottom = np.empty(nPts - 2)
+
+        # Get the direction normal to the chord line
+        direction = np.array([-self._sin_twist, self._cos_twist])
+
+        # The rays through the airfoil in the given direction at every chord point
+        offset = self.chord * direction
+        rays = np.stack((chord_pts + offset, chord_pts - offset), axis=1)
+
+        # The rays are spaced linearly along the chord, which approximates the location of the intersections.
+        # top surf goes from 0 at TE to 1 at LE, so parameter needs to be reversed
+        top_guess = 1 - lin_sampling
+        bottom_guess = lin_sampling
+
+        # A single linear spline is reused for every ray by swapping its control points
+        normal = Curve(t=[0, 0, 1, 1], k=2, coef=rays[0])
 
         # At each point we are looking for the camber
         for j in range(chord_pts.shape[0]):
-            # Get the direction normal to the chord line
-            direction = np.array(
-                [np.cos(np.pi / 2 + np.deg2rad(self.twist)), np.sin(np.pi / 2 + np.deg2rad(self.twist))]
-            )
-            direction = direction / np.linalg.norm(direction)
-
             # Draw a ray through the airfoil in the given direction
-            top = chord_pts[j, :] + 1 * self.chord * direction
-            bottom = chord_pts[j, :] - 1 * self.chord * direction
-            temp = np.vstack((top, bottom))
-            normal = Curve(X=temp, k=2)
+            normal.coef = rays[j]
 
             # Determine the intersection of this ray with both the upper and lower surfaces
-            s_top, _, _ = top_surf.projectCurve(normal, nIter=5000, eps=EPS)
-            s_bottom, _, _ = bottom_surf.projectCurve(normal, nIter=5000, eps=EPS)
-            intersect_top = top_surf.getValue(s_top)
-            intersect_bottom = bottom_surf.getValue(s_bottom)
+            s_top[j], _, _ = top_surf.projectCurve(normal, nIter=100, eps=EPS, s=top_guess[j], t=0.5)
+            s_bottom[j], _, _ = bottom_surf.projectCurve(normal, nIter=100, eps=EPS, s=bottom_guess[j], t=0.5)
 
-            # Compute the camber
-            camber_pts[j, :] = (intersect_top + intersect_bottom) / 2
+        # Compute the camber from all of the intersections at once
+        camber_pts = (top_surf.getValue(s_top) + bottom_surf.getValue(s_bottom)) / 2
 
         # Add TE and LE to the camber points.
         camber_pts = np.vstack((self.LE, camber_pts, self.TE))
@@ -365,56 +452,57 @@ class Airfoil:
 
         # The parametric spline values along the camber line to find thickness points
         s = np.linspace(0, 1, nPts - 1, endpoint=False)[1:]
-        thickness_pts = np.zeros((nPts - 2, 2))
+        s_top = np.empty(nPts - 2)
+        s_bottom = np.empty(nPts - 2)
+
+        # Evaluate the camber line at all of the stations at once
+        camber_pts = self.camber.getValue(s)
+
+        # If british we project a ray normal to chordline
+        if tType == "british":
+            directions = np.tile([self._sin_twist, self._cos_twist], (len(s), 1))
+        # If american we project a ray normal to camberline
+        else:
+            dx = np.array([self.camber.getDerivative(s_j) for s_j in s])
+            directions = np.column_stack((-dx[:, 1], dx[:, 0]))
+            directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+
+        # create the rays through the upper and lower surfaces for all stations
+        offsets = 10 * self.chord * directions
+        rays = np.empty((len(s), 2, 2))
+        rays[:, 0] = camber_pts + offsets
+        rays[:, 1] = camber_pts - offsets
+
+        # approximate location of the intersections as a percentage of the chord,
+        # clipped to keep the guesses within the bounds of the spline
+        bottom_guess = np.clip((camber_pts[:, 0] - self.LE[0]) / self.chord, 0, 1)
+
+        # top surf goes from 0 at TE to 1 at LE, so parameter needs to be reversed
+        top_guess = 1 - bottom_guess
+
+        # A single linear spline is reused for every ray by swapping its control points
+        normal = Curve(t=[0, 0, 1, 1], k=2, coef=rays[0])
 
         # Find thickness at each point
         for j in range(len(s)):
-            # If british we project a ray normal to chordline
-            if tType == "british":
-                direction = np.array(
-                    [np.cos(np.pi / 2 - np.deg2rad(self.twist)), np.sin(np.pi / 2 - np.deg2rad(self.twist))]
-                )
-            # If american we project a ray normal to camberline
-            else:
-                dx = self.camber.getDerivative(s[j])
-                direction = np.array([-dx[1], dx[0]])
-            direction = direction / np.linalg.norm(direction)
-
-            # create a ray through the upper and lower surfaces from given direction
-            top = self.camber.getValue(s[j]) + 10 * self.chord * direction
-            bottom = self.camber.getValue(s[j]) - 10 * self.chord * direction
-            normal = Curve(X=np.vstack([top, bottom]), k=2)
-
-            # approximate location of the intersection as a percentage of the chord
-            s_guess = (normal.getValue(0.5)[0] - self.LE[0]) / self.chord
-
-            # top surf goes from 0 at TE to 1 at LE, so parameter needs to be reversed
-            top_guess = 1 - s_guess
-            bottom_guess = s_guess
-
-            # Keep guesses within the bounds of the spline
-            if s_guess > 1:
-                top_guess = 0
-                bottom_guess = 1
-            elif s_guess < 0:
-                top_guess = 1
-                bottom_guess = 0
+            normal.coef = rays[j]
 
             # Find upper and lower intersections
-            s_top, _, _ = top_surf.projectCurve(normal, nIter=100, eps=EPS, s=top_guess, t=0.5)
-            s_bottom, _, _ = bottom_surf.projectCurve(normal, nIter=100, eps=EPS, s=bottom_guess, t=0.5)
-
-            # Compute the thickness
-            thickness_pts[j, 0] = self.camber.getValue(s[j])[0]
-            if tType == "british":
-                thickness_pts[j, 1] = top_surf.getValue(s_top)[1] - bottom_surf.getValue(s_bottom)[1]
-            else:
-                x_top = top_surf.getValue(s_top)
-                x_bottom = bottom_surf.getValue(s_bottom)
-                thickness_pts[j, 1] = np.linalg.norm(x_top - x_bottom)
+            s_top[j], _, _ = top_surf.projectCurve(normal, nIter=100, eps=EPS, s=top_guess[j], t=0.5)
+            s_bottom[j], _, _ = bottom_surf.projectCurve(normal, nIter=100, eps=EPS, s=bottom_guess[j], t=0.5)
+
+        # Compute the thickness from all of the intersections at once
+        x_top = top_surf.getValue(s_top)
+        x_bottom = bottom_surf.getValue(s_bottom)
+        if tType == "british":
+            thickness = x_top[:, 1] - x_bottom[:, 1]
+        else:
+            thickness = np.hypot(x_top[:, 0] - x_bottom[:, 0], x_top[:, 1] - x_bottom[:, 1])
 
         # Add the trailing and leading edge points when we return
-        return np.vstack([[self.LE[0], 0], thickness_pts, [self.TE[0], self.getTEThickness()]])
+        x = np.concatenate(([self.LE[0]], camber_pts[:, 0], [self.TE[0]]))
+        thickness = np.concatenate(([0.0], thickness, [self.getTEThickness()]))
+        return np.column_stack((x, thickness))
 
     def getTEAngle(self):
         """
@@ -427,11 +515,12 @@ class Airfoil:
             The angle of the trailing edge in degrees
         """
         top = self.spline.getDerivative(0)
-        top = top / np.linalg.norm(top)
         bottom = self.spline.getDerivative(1)
-        bottom = bottom / np.linalg.norm(bottom)
-        # print(np.dot(top,bottom))
-        TE_angle = np.pi - np.arccos(np.dot(top, bottom))
+        # pi - arccos(cos) of the angle between the tangents, written with arctan2 which does not need unit
+        # vectors and stays accurate when the tangents are close to parallel
+        cross = top[0] * bottom[1] - top[1] * bottom[0]
+        dot = top[0] * bottom[0] + top[1] * bottom[1]
+        TE_angle = np.arctan2(abs(cross), -dot)
         return np.rad2deg(TE_angle)
 
     def getMaxThickness(self, tType):
@@ -500,10 +589,10 @@ class Airfoil:
             The coordinate that is the perpendicular projection of `coord` onto the chordline
         """
         # vector defines the chord
-        chord = self.LE - self.TE
+        chord = self._chord_vec
 
         # Parametric position of point on chordline
-        s = (-chord[0] * (self.TE[0] - coord[0]) - chord[1] * (self.TE[1] - coord[1])) / (chord[0] ** 2 + chord[1] ** 2)
+        s = (chord[0] * (coord[0] - self.TE[0]) + chord[1] * (coord[1] - self.TE[1])) / self._chord_sq
 
         return self.TE + s * chord
 
@@ -524,41 +613,58 @@ class Airfoil:
 
         max_camber : float
             the maximum camber
+
+        Notes
+        -----
+        The signed distance between the camber line and the chord line is extremal where the camber line is parallel to the chord.
+        The signed distance is sampled on a coarse grid in a single evaluation and the root of the cross product between the camber derivative and the chord
+        is refined with ``brentq`` on either side of the best sample.
+        If no root is bracketed next to it, such as when the best sample is an end of the camber line, the best sample is returned.
+        The result is therefore the global extremum over the whole camber line, including its ends, and this method does not raise if no interior extremum exists.
         """
 
-        def f(s, factor):
-            # Find the perpindicular project onto the chord line
-            pointInterest = self.camber.getValue(s)
-            chordProj = self._findChordProj(pointInterest)
+        TE_x, TE_y = self.TE.tolist()
+        chord_x, chord_y = self._chord_unit.tolist()
 
-            # Determine if distance is +/- with cross product
-            chord = self.LE - self.TE
-            chord /= np.linalg.norm(chord)
-            direction = pointInterest - chordProj
-            direction /= np.linalg.norm(direction)
-            cross = direction[0] * chord[1] - direction[1] * chord[0]
+        def f(s, factor):
+            # The cross product with the unit chord gives the signed perpendicular distance to the chord line.
+            # The perpendicular projection onto the chord line is parallel to the chord, so the cross product
+            # can be taken from the TE instead of from the projected point.
+            x, y = self.camber.getValue(s).tolist()
+            return factor * ((x - TE_x) * chord_y - (y - TE_y) * chord_x)
 
-            return cross * factor * np.linalg.norm(pointInterest - chordProj)
+        def df(s):
+            # Zero where the camber line is parallel to the chord
+            dx_ds, dy_ds = self.camber.getDerivative(s).tolist()
+            return dx_ds * chord_y - dy_ds * chord_x
 
         if maximum:
             factor = -1
         else:
             factor = 1
 
-        opt = minimize(lambda s: f(s, factor), 0.5, method="SLSQP", bounds=[(0, 1)])
+        # Find the best sample of the signed distance on a coarse grid
+        s_grid = np.linspace(0, 1, 51)
+        pts = self.camber.getValue(s_grid)
+        i_opt = np.argmin(factor * ((pts[:, 0] - TE_x) * chord_y - (pts[:, 1] - TE_y) * chord_x))
+
+        # Refine the stationary point on either side of the best sample, at the ends the sample itself is kept
+        candidates = [s_grid[i_opt]]
+        s_near = s_grid[max(i_opt - 1, 0) : i_opt + 2]
+        df_near = [df(s) for s in s_near]
+        for i in range(len(s_near) - 1):
+            if df_near[i] * df_near[i + 1] < 0:
+                candidates.append(brentq(df, s_near[i], s_near[i + 1]))
 
-        if not opt.success:
-            if maximum:
-                raise Error("Could not determine maximum camber.")
-            raise Error("Could not determine minimum camber.")
+        s_opt = min(candidates, key=lambda s: f(s, factor))
 
-        opt_point = self.camber.getValue(opt.x)
+        opt_point = self.camber.getValue(s_opt)
 
         opt_int = self._findChordProj(opt_point)
 
         # convert to airfoil coordinates
-        x = np.linalg.norm(opt_int - self.LE) / np.linalg.norm(self.LE - self.TE)
-        c = factor * f(opt.x, factor) / np.linalg.norm(self.LE - self.TE)
+        x = hypot(opt_int[0] - self.LE[0], opt_int[1] - self.LE[1]) / self.chord
+        c = factor * f(s_opt, factor) / self.chord
 
         return x, c
 
@@ -574,6 +680,11 @@ class Airfoil:
         max_camber : float
             the maximum camber of the airfoil
 
+        Notes
+        -----
+        This is the global maximum over the whole camber line, including its ends at the leading and trailing edge.
+        An airfoil without positive camber returns a maximum camber of about zero at one of the ends.
+        If the camber is about zero everywhere, such as for a symmetric airfoil, the returned x location is arbitrary.
         """
 
         return self._MaxCamberOptimize(True)
@@ -588,6 +699,12 @@ class Airfoil:
             the x location of the maximum ngative camber
         min_camber : float
             the maximum negative camber of the airfoil
+
+        Notes
+        -----
+        This is the global minimum over the whole camber line, including its ends at the leading and trailing edge.
+        An airfoil without negative camber returns a minimum camber of about zero at one of the ends.
+        If the camber is about zero everywhere, such as for a symmetric airfoil, the returned x location is arbitrary.
         """
 
         return self._MaxCamberOptimize(False)
@@ -621,10 +738,11 @@ class Airfoil:
             True if the airfoil is symmetric within the given tolerance
         """
 
-        if abs(self.getMinCamber()[1]) < tol and abs(self.getMaxCamber()[1]) < tol:
-            return True
+        # Skip the maximum camber search if the minimum camber already rules out symmetry
+        if abs(self.getMinCamber()[1]) >= tol:
+            return False
 
-        return False
+        return abs(self.getMaxCamber()[1]) < tol
 
     # ==============================================================================
     # Geometry Modification
@@ -642,9 +760,8 @@ class Airfoil:
         origin : Ndarray [2]
             the point about which to rotate the airfoil
         """
-        new_coords = _rotateCoords(self.spline.X, np.deg2rad(angle), origin)
-
-        self.recompute(new_coords)
+        angle = np.deg2rad(angle)
+        self._affineTransform(lambda X: _rotateCoords(X, angle, origin))
 
     def derotate(self, origin=ZEROS_2):
         """
@@ -663,15 +780,18 @@ class Airfoil:
 
         Parameters
         ----------
-        factor : float
-            the scaling factor
+        factor : float or Ndarray [2]
+            the scaling factor, or separate scaling factors for x and y
 
         origin : Ndarray [2]
             the coordinate about which to preform the scaling
         """
 
-        new_coords = _scaleCoords(self.spline.X, factor, origin)
-        self.recompute(new_coords)
+        if np.ndim(factor) == 0:
+            self._affineTransform(lambda X: _scaleCoords(X, factor, origin))
+        else:
+            # Non-uniform scaling changes the chord length parameterization, so the splines have to be refit
+            self.recompute(_scaleCoords(self.spline.X, factor, origin))
 
     def normalizeChord(self, origin=ZEROS_2):
         """
@@ -696,8 +816,7 @@ class Airfoil:
             the vector that defines the translation of the airfoil
         """
 
-        coords = _translateCoords(self.spline.X, delta)
-        self.recompute(coords)
+        self._affineTransform(lambda X: _translateCoords(X, delta))
 
     def center(self):
         """
@@ -709,7 +828,7 @@ class Airfoil:
 
     def splitAirfoil(self):
         """
-        Splits the airfoil into upper and lower surfaces
+        Splits the airfoil into upper and lower surfaces. The split is cached until the airfoil is recomputed.
 
         Returns
         -------
@@ -720,9 +839,9 @@ class Airfoil:
             A spline that defines the lower surface
         """
 
-        # if self.s_LE is None:
-        # self.getLE()
-        top, bottom = self.spline.splitCurve(self.s_LE)
+        if self._split_cache is None:
+            self._split_cache = self.spline.splitCurve(self.s_LE)
+        top, bottom = self._split_cache
         return top, bottom
 
     def normalizeAirfoil(self, derotate=True, normalize=True, center=True):
@@ -771,11 +890,10 @@ class Airfoil:
         xCut_global = self.LE + xCut * (self.TE - self.LE)
 
         # The direction normal to the chordline
-        direction = np.array([np.cos(np.pi / 2 + np.deg2rad(self.twist)), np.sin(np.pi / 2 + np.deg2rad(self.twist))])
-        direction = direction / np.linalg.norm(direction)
+        direction = np.array([-self._sin_twist, self._cos_twist])
 
         # ray to intersect upper and lower surfaces
-        ray = [xCut_global - 2 * direction * self.getChord(), xCut_global + 2 * direction * self.getChord()]
+        ray = [xCut_global - 2 * direction * self.chord, xCut_global + 2 * direction * self.chord]
         top_surf, bottom_surf = self.splitAirfoil()
         normal = Curve(X=ray, k=2)
 
@@ -793,16 +911,12 @@ class Airfoil:
             )
 
         # Get all the coordinates that will not be cut off
-        coords = [top_surf.getValue(s_top)]
+        # dot product test checks for positive projection onto chord
         chord = self.LE - self.TE
-        for x in self.getSplinePts():
-            # dot product test checks for positive projection onto chord
-            current_direction = x - xCut_global
-            if chord[0] * current_direction[0] + chord[1] * current_direction[1] > 0:
-                coords.append(np.array(x))
+        keep = chord[0] * (self._x - xCut_global[0]) + chord[1] * (self._y - xCut_global[1]) > 0
 
-        coords.append(np.array(bottom_surf.getValue(s_bottom)))
-        self.recompute(np.array(coords))
+        coords = np.vstack((top_surf.getValue(s_top), self.getSplinePts()[keep], bottom_surf.getValue(s_bottom)))
+        self.recompute(coords)
 
     def sharpenTE(self, xCut=0.98):
         """
@@ -888,19 +1002,27 @@ class Airfoil:
             coeff[3 * ii + 1] = np.array([coeff[ii, 0] + dx * 0.5, coeff[ii, 1] + dy_dx * dx * 0.5])
 
         if k == 4:
-            chord = self.TE - self.LE
-            chord /= np.linalg.norm(chord)
+            # the cached unit chord points from the TE to the LE
+            chord = -self._chord_unit
             coeff[2] = np.array([self.TE[0] + chord[0] * dx, self.TE[1] + chord[1] * dx])
 
         ## make the TE curve
         te_curve = Curve(t=t, k=k, coef=coeff)
 
         # ----- combine the TE curve with the spline curve -----
-        upper_curve, lower_curve = te_curve.splitCurve(0.5)
-        upper_pts = upper_curve.getValue(np.linspace(1, 0, nPts // 2))
-        lower_pts = lower_curve.getValue(np.linspace(1, 0, nPts // 2))
-
-        coords = np.vstack((upper_pts[:-1], self.spline.X, lower_pts[1:]))
+        # both halves of the TE curve are sampled in a single evaluation, each running from its end to s=0.5
+        s_half = 0.5 * np.linspace(1, 0, nPts // 2)
+        te_pts = te_curve.getValue(np.concatenate((s_half, s_half + 0.5)))
+        upper_pts = te_pts[: nPts // 2]
+        lower_pts = te_pts[nPts // 2 :]
+
+        # the s=0 and s=1 ends of the TE curve coincide with the ends of the airfoil spline and are dropped
+        nTE = upper_pts.shape[0] - 1
+        nSurf = self.spline.X.shape[0]
+        coords = np.empty((nSurf + 2 * nTE, 2))
+        coords[:nTE] = upper_pts[:-1]
+        coords[nTE : nTE + nSurf] = self.spline.X
+        coords[nTE + nSurf :] = lower_pts[1:]
 
         # ---- recompute with new TE ---
         self.recompute(coords)
@@ -924,27 +1046,29 @@ class Airfoil:
             The points that were flagged as trailing edge points and removed from the airfoil coordinates.
         """
         coords = self.getSplinePts()
-        chord_vec = self.TE - self.LE
-        unit_chord_vec = chord_vec / np.linalg.norm(chord_vec)
-
-        airfoil_mask = []
-        TE_mask = []
-        for ii in range(coords.shape[0] - 1):  # loop over each element
-            if coords[ii, 0] >= (self.LE + chord_vec * xtol)[0]:
-                delta = coords[ii + 1] - coords[ii]
-                unit_delta = delta / np.linalg.norm(delta)
-
-                if np.abs(np.dot(unit_chord_vec, unit_delta)) < tol:
-                    TE_mask += [ii, ii + 1]
-                else:
-                    airfoil_mask += [ii, ii + 1]
-            else:
-                airfoil_mask += [ii, ii + 1]
-
-        # list(set()) removes the duplicate pts
-        self.recompute(coords[list(set(airfoil_mask))])
-
-        return coords[list(set(TE_mask))]
+        # the cached chord vector runs from the TE to the LE, only the magnitude of the dot product is needed
+        x_threshold = self.LE[0] - self._chord_vec[0] * xtol
+
+        # Classify every element at once, only elements starting past xtol can be part of the TE
+        # |d.c| < tol |d||c| is compared squared so that no element lengths have to be normalized
+        delta = np.diff(coords, axis=0)
+        delta_sq = (delta * delta).sum(axis=1)
+        proj = delta @ self._chord_vec
+        past_xtol = coords[:-1, 0] >= x_threshold
+        TE_elem = past_xtol & (proj * proj < tol * tol * delta_sq * self._chord_sq)
+
+        # Each element contributes both of its points. Boolean masks over the points remove the duplicate pts
+        # and keep the points in their original order.
+        TE_mask = np.zeros(coords.shape[0], dtype=bool)
+        TE_mask[:-1] |= TE_elem
+        TE_mask[1:] |= TE_elem
+        airfoil_mask = np.zeros(coords.shape[0], dtype=bool)
+        airfoil_mask[:-1] |= ~TE_elem
+        airfoil_mask[1:] |= ~TE_elem
+
+        self.recompute(coords[airfoil_mask])
+
+        return coords[TE_mask]
 
     ## Sampling
     def getSampledPts(self, nPts, spacingFunc=sampling.polynomial, func_args=None, nTEPts=0, TE_knot=False):
@@ -970,20 +1094,24 @@ class Airfoil:
             Coordinates array, anticlockwise, from trailing edge
         """
         s = sampling.joinedSpacing(nPts, spacingFunc=spacingFunc, func_args=func_args, s_LE=self.s_LE)
-        sampled_coords = self.spline.getValue(s)
-        if not self.closedCurve and TE_knot:
-            sampled_coords = np.vstack((sampled_coords, sampled_coords[-1]))
+        nSurf = len(s)
+
+        # the blunt TE points are appended after the surface points, so allocate the full output once
+        openTE = not self.closedCurve
+        nKnot = 1 if openTE and TE_knot else 0
+        nTE = nTEPts if openTE else 0
+        sampled_coords = np.empty((nSurf + nKnot + nTE + int(openTE), 2))
+        sampled_coords[:nSurf] = self.spline.getValue(s)
 
-        if nTEPts and not self.closedCurve:
-            coords_TE = np.zeros((nTEPts + 2, sampled_coords.shape[1]))
-            for idim in range(sampled_coords.shape[1]):
-                val1 = self.spline.getValue(1)[idim]
-                val2 = self.spline.getValue(0)[idim]
-                coords_TE[:, idim] = np.linspace(val1, val2, nTEPts + 2)
-            sampled_coords = np.vstack((sampled_coords, coords_TE[1:-1]))
+        if nKnot:
+            sampled_coords[nSurf] = sampled_coords[nSurf - 1]
 
-        if not self.closedCurve:
-            sampled_coords = np.vstack((sampled_coords, sampled_coords[0]))
+        if nTE:
+            coords_TE = np.linspace(self.spline.getValue(1), self.spline.getValue(0), nTEPts + 2)
+            sampled_coords[nSurf + nKnot : -1] = coords_TE[1:-1]
+
+        if openTE:
+            sampled_coords[-1] = sampled_coords[0]
 
         self.sampled_pts = sampled_coords
 
@@ -1031,41 +1159,32 @@ class Airfoil:
             coords = self.getSplinePts()
 
         if xslice is None:
-            xslice = np.zeros(nffd)
-            for i in range(nffd):
-                xtemp = i * 1.0 / (nffd - 1.0)
-                xslice[i] = min(coords[:, 0]) - 1.0 * xmargin + (max(coords[:, 0]) + 2.0 * xmargin) * xtemp
+            xtemp = np.arange(nffd) / (nffd - 1.0)
+            xslice = coords[:, 0].min() - 1.0 * xmargin + (coords[:, 0].max() + 2.0 * xmargin) * xtemp
         else:
+            xslice = np.asarray(xslice)
             nffd = len(xslice)
 
-        FFDbox = np.zeros((nffd, 2, 2, 3))
+        FFDbox = np.empty((nffd, 2, 2, 3))
 
         if fitted:
-            ylower = np.zeros(nffd)
-            yupper = np.zeros(nffd)
-            for i in range(nffd):
-                ymargin = ymarginu + (ymarginl - ymarginu) * xslice[i]
-                yu, yl = _getClosestY(coords, xslice[i])
-                yupper[i] = yu + ymargin
-                ylower[i] = yl - ymargin
+            ymargin = ymarginu + (ymarginl - ymarginu) * xslice
+            yu, yl = _getClosestY(coords, xslice)
+            yupper = yu + ymargin
+            ylower = yl - ymargin
         else:
-            yupper = np.ones(nffd) * (max(coords[:, 1]) + ymarginu)
-            ylower = np.ones(nffd) * (min(coords[:, 1]) - ymarginl)
+            yupper = np.full(nffd, coords[:, 1].max() + ymarginu)
+            ylower = np.full(nffd, coords[:, 1].min() - ymarginl)
 
         # X
-        FFDbox[:, 0, 0, 0] = xslice[:].copy()
-        FFDbox[:, 1, 0, 0] = xslice[:].copy()
+        FFDbox[..., 0] = xslice[:, np.newaxis, np.newaxis]
         # Y
         # lower
-        FFDbox[:, 0, 0, 1] = ylower[:].copy()
+        FFDbox[:, 0, :, 1] = ylower[:, np.newaxis]
         # upper
-        FFDbox[:, 1, 0, 1] = yupper[:].copy()
-        # copy
-        FFDbox[:, :, 1, :] = FFDbox[:, :, 0, :].copy()
-        # Z
-        FFDbox[:, :, 0, 2] = 0.0
+        FFDbox[:, 1, :, 1] = yupper[:, np.newaxis]
         # Z
-        FFDbox[:, :, 1, 2] = 1.0
+        FFDbox[..., 2] = [0.0, 1.0]
 
         return FFDbox
 
@@ -1181,10 +1300,9 @@ class Airfoil:
 
         fig = plt.figure()
         # pts = self._getDefaultSampling(npts=1000)
-        plt.plot(coords[:, 0], coords[:, 1], "-r")
+        # a single line with markers, the markers keep the first colour of the default cycle
+        plt.plot(coords[:, 0], coords[:, 1], "-or", markerfacecolor="C0", markeredgecolor="C0")
         plt.axis("equal")
-        # if self.sampled_X is not None:
-        plt.plot(coords[:, 0], coords[:, 1], "o")
 
         if camber:
             camber_pts = self.camber.getValue(np.linspace(0, 1, 200))
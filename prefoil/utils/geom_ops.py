@@ -189,8 +189,8 @@ def _scaleCoords(X, scale, origin):
     X : Ndarry [N,2]
         The x/y coordinate pairs that are being scaled
 
-    scale : float
-        The scaling factor
+    scale : float or Ndarray [2]
+        The scaling factor, or separate scaling factors for x and y
 
     origin : float
         The location about which scaling occurs (This point will not change)
@@ -208,35 +208,31 @@ def _scaleCoords(X, scale, origin):
 
 def _getClosestY(coords, x):
     """
-    Gets the closest y value on the upper and lower point to an x value
+    Gets the closest y value on the upper and lower point to an x value, or to each of an array of x values
 
     Parameters
     ----------
     coords : Ndarray [N,2]
         coordinates defining the airfoil
 
-    x : float
-        The x value to find the closest point for
+    x : float or Ndarray [M]
+        The x value(s) to find the closest point for
 
     Returns
     -------
-    yu : float
+    yu : float or Ndarray [M]
         The y value of the closest coordinate on the upper surface
 
-    yl : float
+    yl : float or Ndarray [M]
         The y value of the closest coordinate on the lower surface
     """
 
     top = coords[: len(coords + 1) // 2 + 1, :]
     bottom = coords[len(coords + 1) // 2 :, :]
 
-    x_top = np.ones(len(top))
-    for i in range(len(top)):
-        x_top[i] = abs(top[i, 0] - x)
-    yu = top[np.argmin(x_top), 1]
-    x_bottom = np.ones(len(bottom))
-    for i in range(len(bottom)):
-        x_bottom[i] = abs(bottom[i, 0] - x)
-    yl = bottom[np.argmin(x_bottom), 1]
+    # Compare every x value against all of the surface points at once
+    x = np.asarray(x)[..., np.newaxis]
+    yu = top[np.argmin(np.abs(top[:, 0] - x), axis=-1), 1]
+    yl = bottom[np.argmin(np.abs(bottom[:, 0] - x), axis=-1), 1]
 
     return yu, yl
@@ -84,18 +84,13 @@ def _writePlot3D(filename, x, y):
     """
     filename += ".xyz"
 
+    nPts = len(x)
+
     with open(filename, "w") as f:
         f.write("1\n")
-        f.write("%d %d %d\n" % (len(x), 2, 1))
-        for iDim in range(3):
-            for j in range(2):
-                for i in range(len(x)):
-                    if iDim == 0:
-                        f.write("%g\n" % x[i])
-                    elif iDim == 1:
-                        f.write("%g\n" % y[i])
-                    else:
-                        f.write("%g\n" % (float(j)))
+        f.write("%d %d %d\n" % (nPts, 2, 1))
+        # x, y and z blocks, each repeated for the two planes, one value per line
+        np.savetxt(f, np.concatenate((x, x, y, y, np.zeros(nPts), np.ones(nPts))), fmt="%g")
 
 
 def _writeDat(filename, x, y):
@@ -117,9 +112,11 @@ def _writeDat(filename, x, y):
 
     filename += ".dat"
 
+    x = np.round(x, 12).tolist()
+    y = np.round(y, 12).tolist()
+
     with open(filename, "w") as f:
-        for i in range(len(x)):
-            f.write(str(round(x[i], 12)) + "\t\t" + str(round(y[i], 12)) + "\n")
+        f.write("".join(str(xi) + "\t\t" + str(yi) + "\n" for xi, yi in zip(x, y)))
 
 
 def _writeFFD(FFDbox, filename):
@@ -142,9 +139,5 @@ def _writeFFD(FFDbox, filename):
     with open(filename + ".xyz", "w") as f:
         f.write("1\n")
         f.write(str(nffd) + " 2 2\n")
-        for ell in range(3):
-            for k in range(2):
-                for j in range(2):
-                    for i in range(nffd):
-                        f.write("%.15f " % (FFDbox[i, j, k, ell]))
-                    f.write("\n")
+        # one row per (ell, k, j) with i running along the row
+        np.savetxt(f, FFDbox.transpose(3, 2, 1, 0).reshape(12, nffd), fmt="%.15f", newline=" \n")
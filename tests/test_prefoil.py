@@ -234,6 +234,16 @@ class TestGeoModification(unittest.TestCase):
         assert_allclose(X[0][0], 1.0, rtol=1e-4)
         assert_allclose(X[-1][0], 1.0, rtol=1e-4)
 
+    def test_scale_nonuniform(self):
+        X = readCoordFile(os.path.join(baseDir, "airfoils/rae2822.dat"))
+        foil = Airfoil(X)
+        foil.rotate(20)
+        ref_foil = Airfoil(foil.getSplinePts() * np.array([1.0, 3.0]))
+        foil.scale(np.array([1.0, 3.0]))
+        assert_allclose(foil.LE, ref_foil.LE, atol=1e-12)
+        assert_allclose(foil.twist, ref_foil.twist, atol=1e-12)
+        assert_allclose(foil.getMaxCamber(), ref_foil.getMaxCamber(), atol=1e-12)
+
 
 class TestFFD(unittest.TestCase):
     def setUp(self):
@@ -252,6 +262,11 @@ class TestFFD(unittest.TestCase):
         self.assertEqual(yu, 0)
         self.assertEqual(yl, 0)
 
+    def test_getClosest_array(self):
+        yu, yl = _getClosestY(self.wave.getSplinePts(), np.array([0.3, -1]))
+        assert_array_equal(yu, np.array([0.25, 0]))
+        assert_array_equal(yl, np.array([-0.25, 0]))
+
     def test_box_FFD(self):
         FFD_box = self.foil._buildFFD(4, False, 0.001, 0.02, 0.02, None, None)
         FFD_box_actual = np.zeros((4, 2, 2, 3))
@@ -353,6 +368,34 @@ class TestCamber(unittest.TestCase):
         maxCamber = self.foil.getMaxCamber()
         assert_allclose(maxCamber, [0.757, 0.013], rtol=0.1)
 
+    def test_s_camber(self):
+        # S-shaped camber line with negative camber well inside the chord, the extrema are +-0.02 at x = 0.25 and 0.75
+        x = 0.5 * (1 - np.cos(np.linspace(0, np.pi, 201)))
+        yc = 0.02 * np.sin(2 * np.pi * x)
+        yt = 0.6 * (0.2969 * np.sqrt(x) - 0.126 * x - 0.3516 * x**2 + 0.2843 * x**3 - 0.1036 * x**4)
+        upper = np.column_stack((x[::-1], (yc + yt)[::-1]))
+        lower = np.column_stack((x[1:], (yc - yt)[1:]))
+        foil = Airfoil(np.vstack((upper, lower)))
+        assert_allclose(foil.getMaxCamber(), [0.25, 0.02], atol=1e-4)
+        assert_allclose(foil.getMinCamber(), [0.75, -0.02], atol=1e-4)
+
+    def test_twisted_blade_min_camber(self):
+        # the minimum camber is searched over the whole camber line, no sample of it can be lower
+        foil = Airfoil(readCoordFile(os.path.join(baseDir, "airfoils/twisted_blade_section.dat")))
+        x, c = foil.getMinCamber()
+        camber_pts = foil.getCamber().getValue(np.linspace(0, 1, 10001))
+        unit_chord = (foil.LE - foil.TE) / foil.chord
+        rel_pts = camber_pts - foil.TE
+        dist = (rel_pts[:, 0] * unit_chord[1] - rel_pts[:, 1] * unit_chord[0]) / foil.chord
+        self.assertLessEqual(c, dist.min() + 1e-12)
+
+    def test_symmetric_camber(self):
+        foil = Airfoil(readCoordFile(os.path.join(baseDir, "airfoils/hypersonic_glider.dat")))
+        for x, c in [foil.getMaxCamber(), foil.getMinCamber()]:
+            self.assertTrue(0.0 <= x <= 1.0)
+            assert_allclose(c, 0.0, atol=1e-12)
+        self.assertTrue(foil.isSymmetric())
+
 
 class TestFileWriting(unittest.TestCase):
     def setUp(self):